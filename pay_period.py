@@ -1,8 +1,21 @@
+import bisect
 import datetime
-from typing import List, Tuple
+import functools
+import logging
+import operator
+from typing import List, Optional, Tuple
 from dataclasses import dataclass
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _days(days: int) -> datetime.timedelta:
+    """One shared timedelta per period length."""
+    return datetime.timedelta(days=days)
+
+
+@dataclass(slots=True)
 class PayPeriod:
     """Generates a pay period.
 
@@ -24,11 +37,10 @@ class PayPeriod:
                 float: the pto added
                 date: the end date of the pay period
         """
-        current_pto += self.hours_per_period
-        current_date += datetime.timedelta(days=self.period_length)
-        return (current_pto, current_date)
+        return (current_pto + self.hours_per_period,
+                current_date + _days(self.period_length))
 
-@dataclass
+@dataclass(slots=True)
 class Vacation:
     """Class to use for information about a vacation
 
@@ -42,12 +54,10 @@ class Vacation:
     def __lt__(self, other):
         if isinstance(other, Vacation):
             return self.start_date < other.start_date
-        if isinstance(other, datetime.date):
-            return self.start_date < other
-        raise TypeError(
-            f"'<' not supported between instances of Vacation and {type(other)}")
+        # Anything other than a date is rejected by date's own comparison
+        return self.start_date < other
 
-@dataclass
+@dataclass(slots=True)
 class AccruementPeriod:
     """Type for PTOAccruement to hold the information of each period
     
@@ -63,12 +73,74 @@ class AccruementPeriod:
     accruement: float
 
 
+def _schedule(today: int, deadlines: List[int], period_lengths: List[int],
+              period_accruements: List[float]) -> Tuple[List[int], List[float], int]:
+    """Lays out every pay period from today through the last period's deadline.
+
+    Args:
+        today (int): the ordinal of the day the first pay period starts on
+        deadlines (List[int]): the ordinal of the last day a pay period can start on, per period
+        period_lengths (List[int]): the length in days of a pay period, per period
+        period_accruements (List[float]): the PTO accrued each pay period, per period
+
+    Returns:
+        Tuple[List[int], List[float], int]:
+            List[int]: the ordinal of the day each pay period starts on
+            List[float]: the PTO accrued during each pay period
+            int: the ordinal of the day after the last pay period
+    """
+    starts: List[int] = []
+    accruements: List[float] = []
+    for deadline, period_length, accruement in zip(deadlines, period_lengths, period_accruements):
+        period_starts = range(today, deadline + 1, period_length)
+        starts.extend(period_starts)
+        accruements.extend([accruement] * len(period_starts))
+        today += len(period_starts) * period_length
+    return starts, accruements, today
+
+
+def _accrue(starts: List[int], accruements: List[float],
+            vacation_starts: List[int], vacation_hours: List[float],
+            starting_pto: float) -> Tuple[float, List[float]]:
+    """Runs the pay period schedule against the vacations using only ints and floats.
+
+    Args:
+        starts (List[int]): the ordinal of the day each pay period starts on
+        accruements (List[float]): the PTO accrued during each pay period
+        vacation_starts (List[int]): the sorted ordinals of the days each vacation starts on
+        vacation_hours (List[float]): the PTO hours each vacation uses
+        starting_pto (float): PTO to start with
+
+    Returns:
+        Tuple[float, List[float]]:
+            float: the PTO at the end
+            List[float]: The pto at the end of each pay period
+    """
+    used_ptos = [0.0] * len(starts)
+    index = 0
+    for vacation_start, hours in zip(vacation_starts, vacation_hours):
+        # A vacation is used in the first pay period that starts after it.
+        # vacation_starts is sorted, so the search can start from the last hit.
+        index = bisect.bisect_right(starts, vacation_start, lo=index)
+        if index == len(used_ptos):
+            break
+        used_ptos[index] += hours
+    intermediate_ptos: List[float] = []
+    pto = starting_pto
+    for accruement, used_pto in zip(accruements, used_ptos):
+        # Add the accruement before taking out the usage, like next_period,
+        # so the floats come out the same either way
+        pto = pto + accruement - used_pto
+        intermediate_ptos.append(pto)
+    return pto, intermediate_ptos
+
+
 class PTOAccruement:
     """Class used to handle PTO accruing"""
 
     def __init__(self, periods: List[AccruementPeriod],
                  starting_pto: float = 0,
-                 starting_day: datetime.date = datetime.date.today()) -> None:
+                 starting_day: Optional[datetime.date] = None) -> None:
         """PTO accrual handler.
 
         Args:
@@ -80,7 +152,18 @@ class PTOAccruement:
         """
         self.periods = periods
         self.pto = starting_pto
-        self.today = starting_day
+        if starting_day is None:
+            starting_day = datetime.date.today()
+        self._today_ordinal = starting_day.toordinal()
+
+    @property
+    def today(self) -> datetime.date:
+        """The day the next pay period starts on."""
+        return datetime.date.fromordinal(self._today_ordinal)
+
+    @today.setter
+    def today(self, value: datetime.date) -> None:
+        self._today_ordinal = value.toordinal()
 
     class PastDateException(Exception):
         """Raised when the current date is further than the end date."""
@@ -99,19 +182,39 @@ class PTOAccruement:
             float: the amount of PTO remaining after this period
         """
         period = self.periods[0]
-        end, pay_period = (period.end_date, PayPeriod(
-            period.accruement, period.period_length))
         # Add a buffer at the end to let it go 1 period past
         # So we don't lose PTO used on the last week.
-        if self.today > (end + datetime.timedelta(days=pay_period.period_length)):
+        while self._today_ordinal > period.end_date.toordinal() + period.period_length:
             if len(self.periods) == 1:
                 raise self.PastDateException
             self.periods.pop(0)
-            return self.next_period(pto_use)
-        self.pto, self.today = pay_period.add_pto(self.pto, self.today)
-        self.pto -= pto_use
+            period = self.periods[0]
+        self._today_ordinal += period.period_length
+        self.pto = self.pto + period.accruement - pto_use
         return self.pto
 
+    def _pay_period_schedule(self) -> Tuple[List[int], List[float]]:
+        """Walks the periods the same way next_period does, without accruing anything.
+        Exhausted periods are removed and self.today is moved to the end of the last pay period.
+
+        Returns:
+            Tuple[List[int], List[float]]:
+                List[int]: the ordinal of the day each pay period starts on
+                List[float]: the PTO accrued during each pay period
+        """
+        periods = self.periods
+        # The fields of each period pulled out into flat lists. They're read from
+        # self.periods on every call so any change made to the periods is picked up.
+        # A deadline is the last day a pay period of that period can start on:
+        # the end date plus a buffer of 1 period so we don't lose PTO used on the last week.
+        starts, accruements, self._today_ordinal = _schedule(
+            self._today_ordinal,
+            [period.end_date.toordinal() + period.period_length for period in periods],
+            [period.period_length for period in periods],
+            [period.accruement for period in periods])
+        del periods[:-1]
+        return starts, accruements
+
     def get_final_pto(self, vacations: List[Vacation]) -> Tuple[float, List[float]]:
         """Iterates until self.end_date.
 
@@ -123,22 +226,15 @@ class PTOAccruement:
                 float: the PTO at the end
                 List[float]: The pto at the end of each pay period 
         """
-        intermediate_ptos = []
-        vacations = sorted(vacations)
-        print(f'Start date is {self.today}')
-        while True:
-            used_pto: float = 0
-            try:
-                for date in vacations:
-                    if date < self.today:
-                        used_pto += date.length
-                        vacations.remove(date)
-                    else:
-                        break
-                intermediate_ptos.append(self.next_period(used_pto))
-            except self.PastDateException:
-                break
-        print(f'End date is {self.today}')
+        vacations = sorted(vacations, key=operator.attrgetter('start_date'))
+        logger.debug('Start date is %s', self.today)
+        starts, accruements = self._pay_period_schedule()
+        self.pto, intermediate_ptos = _accrue(
+            starts, accruements,
+            [vacation.start_date.toordinal() for vacation in vacations],
+            [vacation.length for vacation in vacations],
+            self.pto)
+        logger.debug('End date is %s', self.today)
         return self.pto, intermediate_ptos
 
 
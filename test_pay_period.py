@@ -0,0 +1,128 @@
+import datetime
+import operator
+import unittest
+
+from pay_period import AccruementPeriod, PTOAccruement, Vacation
+
+
+class GetFinalPTOTest(unittest.TestCase):
+    """The expected values are exact floats from the original step-by-step implementation
+    with its skipped vacation bug fixed, so any change to the order the PTO is added up in
+    shows up here."""
+
+    def test_example(self):
+        sd = datetime.date(2023, 1, 27)
+        periods = [AccruementPeriod(14, sd, datetime.date(2023, 4, 4), 5.85),
+                   AccruementPeriod(14, datetime.date(2023, 4, 4), datetime.date(2023, 12, 31), 7.40)]
+        vacations = [Vacation(datetime.date(2023, 3, 6), 40),
+                     Vacation(datetime.date(2023, 5, 1), 40),
+                     Vacation(datetime.date(2023, 7, 3), 32),
+                     Vacation(datetime.date(2023, 9, 4), 32),
+                     Vacation(datetime.date(2023, 11, 24), 24),
+                     Vacation(datetime.date(2023, 12, 25), 24)]
+        final_pto, intermediate_ptos = PTOAccruement(periods, 33.42, sd).get_final_pto(vacations)
+        self.assertEqual(final_pto, 24.520000000000003)
+        self.assertEqual(intermediate_ptos, [
+            39.27, 45.120000000000005, 50.970000000000006, 16.820000000000007,
+            22.67000000000001, 28.52000000000001, 35.92000000000001, 3.3200000000000074,
+            10.720000000000008, 18.120000000000008, 25.52000000000001, 32.92000000000001,
+            8.320000000000007, 15.720000000000008, 23.120000000000008, 30.52000000000001,
+            5.920000000000009, 13.32000000000001, 20.72000000000001, 28.12000000000001,
+            35.52000000000001, 42.92000000000001, 26.320000000000007, 33.720000000000006,
+            17.120000000000005, 24.520000000000003])
+
+    def test_vacations_in_same_pay_period(self):
+        # All three are used in the second pay period,
+        # none are pushed back to the one after it
+        sd = datetime.date(2023, 1, 6)
+        periods = [AccruementPeriod(14, sd, datetime.date(2023, 2, 17), 5.0)]
+        vacations = [Vacation(datetime.date(2023, 1, 9), 8),
+                     Vacation(datetime.date(2023, 1, 10), 8),
+                     Vacation(datetime.date(2023, 1, 11), 0.5)]
+        final_pto, intermediate_ptos = PTOAccruement(periods, 40.0, sd).get_final_pto(vacations)
+        self.assertEqual(final_pto, 48.5)
+        self.assertEqual(intermediate_ptos, [45.0, 33.5, 38.5, 43.5, 48.5])
+
+    def test_uses_reassigned_periods(self):
+        sd = datetime.date(2023, 1, 6)
+        accruement = PTOAccruement([AccruementPeriod(14, sd, datetime.date(2023, 2, 3), 5.85)], 0, sd)
+        accruement.periods = [AccruementPeriod(7, sd, datetime.date(2023, 1, 20), 1.0)]
+        self.assertEqual(accruement.get_final_pto([]), (4.0, [1.0, 2.0, 3.0, 4.0]))
+        self.assertEqual(accruement.today, datetime.date(2023, 2, 3))
+
+    def test_many_vacations(self):
+        sd = datetime.date(2023, 1, 6)
+        periods = [AccruementPeriod(14, sd, datetime.date(2023, 6, 30), 6.23),
+                   AccruementPeriod(14, datetime.date(2023, 6, 30), datetime.date(2023, 12, 29), 6.77)]
+        # Several of these land in the same pay period
+        vacations = [Vacation(sd + datetime.timedelta(days=days), hours) for days, hours in [
+            (3, 8), (4, 8), (5, 0.5), (40, 16), (41, 8), (90, 4.25),
+            (150, 8), (151, 8), (152, 8), (200, 1.5), (300, 40), (330, 2.75)]]
+        final_pto, intermediate_ptos = PTOAccruement(periods, 37.09, sd).get_final_pto(vacations)
+        self.assertEqual(final_pto, 99.32)
+        self.assertEqual(intermediate_ptos, [
+            43.32000000000001, 33.05000000000001, 39.280000000000015, 21.51000000000002,
+            27.74000000000002, 33.97000000000002, 40.20000000000002, 42.18000000000002,
+            48.410000000000025, 54.64000000000003, 60.87000000000003, 43.10000000000004,
+            49.33000000000004, 55.560000000000045, 62.33000000000004, 67.60000000000004,
+            74.37000000000003, 81.14000000000003, 87.91000000000003, 94.68000000000002,
+            101.45000000000002, 108.22000000000001, 74.99000000000001, 81.76, 85.78,
+            92.55, 99.32])
+
+
+class VacationTest(unittest.TestCase):
+
+    def test_less_than(self):
+        vacation = Vacation(datetime.date(2023, 3, 6), 40)
+        self.assertTrue(vacation < Vacation(datetime.date(2023, 3, 7), 8))
+        self.assertFalse(vacation < Vacation(datetime.date(2023, 3, 6), 8))
+        self.assertTrue(vacation < datetime.date(2023, 3, 7))
+        self.assertFalse(vacation < datetime.date(2023, 3, 6))
+        self.assertRaises(TypeError, operator.lt, vacation, 1)
+        self.assertRaises(TypeError, operator.lt, vacation, '2023-03-07')
+
+
+class PTOAccruementTest(unittest.TestCase):
+
+    def test_starting_day_defaults_to_today(self):
+        accruement = PTOAccruement([AccruementPeriod(14, datetime.date(2023, 1, 6), datetime.date(2023, 2, 3), 5.85)])
+        self.assertEqual(accruement.today, datetime.date.today())
+
+
+class NextPeriodTest(unittest.TestCase):
+
+    def test_steps_through_periods(self):
+        sd = datetime.date(2023, 1, 6)
+        periods = [AccruementPeriod(14, sd, datetime.date(2023, 1, 20), 6.23),
+                   AccruementPeriod(14, datetime.date(2023, 1, 20), datetime.date(2023, 2, 17), 6.77)]
+        accruement = PTOAccruement(periods, 37.09, sd)
+        steps = [(0, 43.32000000000001, datetime.date(2023, 1, 20)),
+                 (16, 33.55000000000001, datetime.date(2023, 2, 3)),
+                 # Still the first period thanks to the 1 period buffer
+                 (8, 31.780000000000015, datetime.date(2023, 2, 17)),
+                 (0, 38.55000000000001, datetime.date(2023, 3, 3)),
+                 (2.5, 42.82000000000001, datetime.date(2023, 3, 17))]
+        for pto_use, pto, today in steps:
+            self.assertEqual(accruement.next_period(pto_use), pto)
+            self.assertEqual(accruement.pto, pto)
+            self.assertEqual(accruement.today, today)
+        with self.assertRaises(PTOAccruement.PastDateException):
+            accruement.next_period()
+        self.assertEqual(accruement.pto, 42.82000000000001)
+        self.assertEqual(accruement.today, datetime.date(2023, 3, 17))
+
+    def test_uses_edited_periods(self):
+        sd = datetime.date(2023, 1, 6)
+        accruement = PTOAccruement([AccruementPeriod(14, sd, datetime.date(2023, 1, 20), 5.85)], 0, sd)
+        accruement.periods[0].accruement = 9
+        self.assertEqual(accruement.next_period(), 9)
+        accruement.periods.append(AccruementPeriod(7, datetime.date(2023, 1, 20), datetime.date(2023, 2, 10), 1.0))
+        self.assertEqual(accruement.next_period(), 18)
+        self.assertEqual(accruement.next_period(), 27)
+        # Past the first period's buffer, so the appended one is used
+        self.assertEqual(accruement.next_period(), 28)
+        self.assertEqual(accruement.today, datetime.date(2023, 2, 24))
+
+
+if __name__ == '__main__':
+    unittest.main()